@@ -1,24 +1,149 @@
-from collections import OrderedDict
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+import functools
 import os
+import string
+import struct
 import textwrap
 import time
 
 import typer
-import yaml
-import msgpack
+import msgspec
+
+if TYPE_CHECKING:
+    from github import Github
+    from github.Issue import Issue
+    from github.Repository import Repository
+
 
-from github import Github
-from github import Auth
-from github.Issue import Issue
-from github.Repository import Repository
+class _LazyLogger:
+    """
+    Proxy to the loguru logger, only importing loguru on first use
+    to keep the CLI startup fast
+    """
 
-from loguru import logger
+    def __getattr__(self, name: str) -> Any:
+        from loguru import logger
+
+        return getattr(logger, name)
+
+
+logger = _LazyLogger()
 
 DEFAULT_CONFIG = {"owner": "uw-ssec", "repo": "codeuw", "repos": []}
 DEFAULT_STATE_FILE = ".codeuw-state.mpk"
 DEFAULT_CONFIG_FILE = ".codeuw-config.yml"
+# Version of the state file format, bumped to 2.0 when it became framed
+STATE_VERSION = "2.0"
+ISSUE_TEMPLATE_PATH = ".github/ISSUE_TEMPLATE/task.yml"
+MAX_FETCH_WORKERS = 8
+# Margin taken off the local clock when Github's server time is unknown
+SYNC_CLOCK_MARGIN = 300
+# State file frames are prefixed by their length as a 4-byte big-endian integer
+STATE_FRAME_HEADER = struct.Struct(">I")
+
+
+class TemplateCache(msgspec.Struct):
+    """
+    Parsed issue template, cached by the template file's git SHA
+    """
+
+    sha: str
+    title: str
+    labels: List[str]
+    body_template: str
+
+
+class CachedIssues(msgspec.Struct):
+    """
+    Issue numbers of a repository's codeuw issues list,
+    cached for conditional requests by the list's ETag
+    """
+
+    etag: str
+    numbers: List[int]
+
+
+class CodeuwState(msgspec.Struct, tag="snapshot"):
+    """
+    The codeuw state, mapping each repository's issue numbers
+    to the corresponding issue numbers in the codeuw repo
+    """
+
+    version: str
+    created_time: int
+    last_modified: int
+    issues: Dict[str, Dict[int, int]]
+    template_cache: Optional[TemplateCache] = None
+    etags: Dict[str, CachedIssues] = msgspec.field(default_factory=dict)
+    last_sync: Dict[str, int] = msgspec.field(default_factory=dict)
+
+
+class IssueAdded(msgspec.Struct, tag="add"):
+    """
+    State event recording a codeuw issue created from a repository issue
+    """
+
+    repo: str
+    src: int
+    dst: int
+    ts: int
+
+
+StateRecord = Union[CodeuwState, IssueAdded]
+
+
+class IssueTemplate(NamedTuple):
+    """
+    Parsed issue template, with the title formatter
+    and body renderer to create issues from it
+    """
+
+    title: Callable[..., str]
+    body: Callable[[Dict[str, str]], str]
+    labels: List[str]
+
+
+class FetchedRepo(NamedTuple):
+    """
+    Repository fetched from Github, with its issues with codeuw label
+    """
+
+    repo: Dict[str, str]
+    gh_repo: Repository
+    issues: List[Issue]
+    cached_issues: Optional[CachedIssues]
+    sync_time: int
+
+
+class IssuePayload(NamedTuple):
+    """
+    Rendered codeuw issue, ready to be created
+    """
+
+    title: str
+    body: str
+    labels: List[str]
+
+
+def _safe_load_yaml(stream: "str | bytes") -> Any:
+    """
+    Safely load YAML, using the libyaml C bindings when available
+    and falling back to the pure-Python loader otherwise
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+    return yaml.load(stream, Loader=SafeLoader)
 
 
 def load_config(config_file: str = DEFAULT_CONFIG_FILE) -> Dict[str, Any]:
@@ -36,7 +161,7 @@ def load_config(config_file: str = DEFAULT_CONFIG_FILE) -> Dict[str, Any]:
         The configuration dictionary
     """
     config_path = Path(config_file)
-    config = yaml.safe_load(config_path.read_text())
+    config = _safe_load_yaml(config_path.read_text())
 
     # Set defaults, in case they're not in the config file
     for key, value in DEFAULT_CONFIG.items():
@@ -54,6 +179,8 @@ def setup_github() -> Github:
     Github
         Github API object
     """
+    from github import Auth, Github
+
     # using an access token
     # it'll look for environment variable GITHUB_TOKEN
     auth = Auth.Token(os.environ.get("GITHUB_TOKEN"))
@@ -62,65 +189,254 @@ def setup_github() -> Github:
     return Github(auth=auth)
 
 
-def parse_issue_template(codeuw_repo: Repository) -> Dict[str, Any]:
+def enable_conditional_issues_request(
+    gh: Github, issues_url: str, etag: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Make the Github API object send the first request of the issues list
+    conditionally on the given ETag. A 304 response, which doesn't count
+    against the rate limit, is served as an empty issues list
+
+    Parameters
+    ----------
+    gh : Github
+        The Github API object
+    issues_url : str
+        The URL of the repository's issues list
+    etag : str, optional
+        The ETag of the issues list from the last sync
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionary receiving the ``status`` and ``headers``
+        of the issues list response once requested
+    """
+    requester = gh.requester
+    request_json = requester.requestJson
+    response = {}
+
+    def conditional_request_json(verb, url, parameters=None, headers=None, *args, **kwargs):
+        if verb != "GET" or url != issues_url or response:
+            return request_json(verb, url, parameters, headers, *args, **kwargs)
+
+        if etag is not None:
+            headers = {**(headers or {}), "If-None-Match": etag}
+        status, response_headers, output = request_json(verb, url, parameters, headers, *args, **kwargs)
+        response.update(status=status, headers=response_headers)
+        if status == 304:
+            return 200, response_headers, "[]"
+        return status, response_headers, output
+
+    requester.requestJson = conditional_request_json
+    return response
+
+
+def _compile_template(template: str) -> Callable[[Dict[str, str]], str]:
+    """
+    Compile a ``str.format`` style template into a render function
+    taking a dictionary of field values, so that the template
+    is only parsed once rather than on every render
+    """
+    parsed = [(literal, field) for literal, field, _, _ in string.Formatter().parse(template)]
+
+    def render(sub: Dict[str, str]) -> str:
+        return "".join(literal + (sub[field] if field else "") for literal, field in parsed)
+
+    return render
+
+
+@functools.lru_cache(maxsize=None)
+def _template_formatters(title_template: str, body_template: str) -> Tuple[Callable, Callable]:
+    """
+    Get the title formatter and the compiled body renderer for the given
+    templates, memoized so that identical templates share the same formatters
+    """
+    return title_template.format, _compile_template(body_template)
+
+
+def parse_issue_template(codeuw_repo: Repository, codeuw_state: Optional[CodeuwState] = None) -> IssueTemplate:
     """
     Parse the issue template from the codeuw repository
-    and output a dictionary of the template
 
     Parameters
     ----------
     codeuw_repo : Repository
         The codeuw repository to parse the issue template from
+    codeuw_state : CodeuwState, optional
+        The codeuw state. When given, the parsed template
+        is cached in it and reused as long as the template file's
+        git SHA doesn't change
+
+    Returns
+    -------
+    IssueTemplate
+        The parsed issue template
+    """
+    issue_template_content_file = codeuw_repo.get_contents(path=ISSUE_TEMPLATE_PATH)
+    template_cache = codeuw_state.template_cache if codeuw_state is not None else None
+
+    if template_cache and template_cache.sha == issue_template_content_file.sha:
+        # Template file is unchanged, reuse the cached parse
+        logger.info(f"Issue template unchanged ({issue_template_content_file.sha}), using cached template")
+        title_template = template_cache.title
+        labels = template_cache.labels
+        body_template = template_cache.body_template
+    else:
+        issue_template = _safe_load_yaml(issue_template_content_file.decoded_content)
+
+        # Create the body markdown template
+        body_template = "".join(
+            f'### {input["attributes"]["label"]}\n\n' f'{{{input["id"]}}}\n\n'
+            for input in issue_template["body"]
+        )
+
+        title_template = issue_template["title"] + "{project_name} - {title_text}"
+        labels = issue_template["labels"]
+
+        if codeuw_state is not None:
+            codeuw_state.template_cache = TemplateCache(
+                sha=issue_template_content_file.sha,
+                title=title_template,
+                labels=labels,
+                body_template=body_template,
+            )
+
+    title_format, body_format = _template_formatters(title_template, body_template)
+    return IssueTemplate(title=title_format, body=body_format, labels=labels)
+
+
+def fetch_repo_issues(
+    repo: Dict[str, str],
+    since: Optional[int] = None,
+    cached_issues: Optional[CachedIssues] = None,
+) -> FetchedRepo:
+    """
+    Fetch a repository and its issues with codeuw label
+
+    Parameters
+    ----------
+    repo : Dict[str, str]
+        The repository entry from config
+    since : int, optional
+        Unix timestamp to only fetch the issues updated since,
+        by default all issues are fetched
+    cached_issues : CachedIssues, optional
+        The issues list cached by the last sync. Its issues must all be
+        synced already, since they are skipped when the list is unchanged
 
     Returns
     -------
-    dict
-        The dictionary of the issue template
-    """
-    issue_template_content_file = codeuw_repo.get_contents(path=".github/ISSUE_TEMPLATE/task.yml")
-    issue_template = yaml.safe_load(issue_template_content_file.decoded_content)
-
-    # Create the body markdown template
-    body_template = ""
-    for input in issue_template["body"]:
-        input_id = input["id"]
-        section_string = textwrap.dedent(
-            f'### {input["attributes"]["label"]}\n\n' f"{{{input_id}}}\n\n"
+    FetchedRepo
+        The repository entry from config, the Github repository object,
+        the list of ``Issue`` objects with codeuw label to sync,
+        the issues list to cache for the next sync and the
+        Github server time of the issues list, to sync from next time
+    """
+    # PyGithub's requester isn't thread-safe, as it shares a single
+    # connection between requests, so each fetch uses its own Github object
+    gh = setup_github()
+    repo_path = "/".join([repo["org"], repo["repo"]])
+    gh_repo = gh.get_repo(repo_path)
+    response = enable_conditional_issues_request(
+        gh, f"{gh_repo.url}/issues", cached_issues.etag if cached_issues else None
+    )
+    # Get issues with codeuw label only,
+    # letting Github filter them server-side
+    if since is None:
+        issues = gh_repo.get_issues(state="open", labels=["codeuw"])
+    else:
+        issues = gh_repo.get_issues(
+            state="open",
+            labels=["codeuw"],
+            since=datetime.fromtimestamp(since, tz=timezone.utc),
+        )
+    # Use Github's clock for the sync time, as the since parameter
+    # is compared against the issues' server-side updated time
+    local_sync_time = int(time.time()) - SYNC_CLOCK_MARGIN
+    issues_with_label = list(issues)
+    response_headers = response.get("headers", {})
+    if "date" in response_headers:
+        sync_time = int(parsedate_to_datetime(response_headers["date"]).timestamp())
+    else:
+        sync_time = local_sync_time
+
+    if response.get("status") == 304:
+        # Unchanged since the last sync
+        return FetchedRepo(repo, gh_repo, issues_with_label, cached_issues, sync_time)
+    if response.get("status") == 200 and "etag" in response_headers and 'rel="next"' not in response_headers.get("link", ""):
+        # Only cache single page lists, which the first request's ETag covers
+        cached_issues = CachedIssues(
+            etag=response_headers["etag"],
+            numbers=[issue.number for issue in issues_with_label],
         )
-        body_template += section_string
+    else:
+        cached_issues = None
+    return FetchedRepo(repo, gh_repo, issues_with_label, cached_issues, sync_time)
 
-    # Setup the template dictionary
-    template_dict = {
-        "title": (issue_template["title"] + "{project_name} - {title_text}").format,
-        "labels": issue_template["labels"],
-        "body": body_template.format,
-    }
 
-    return template_dict
+def iter_repo_issues(
+    repos: List[Dict[str, str]], codeuw_state: CodeuwState
+) -> Iterator[FetchedRepo]:
+    """
+    Fetch the repositories and their issues with codeuw label concurrently,
+    yielding each one in config order as soon as it is fetched
+
+    Parameters
+    ----------
+    repos : List[Dict[str, str]]
+        The repository entries from config
+    codeuw_state : CodeuwState
+        The codeuw state, holding the last sync time of each repository,
+        to only fetch the issues updated since, and their cached issues lists.
+        Repositories without a last sync time are fully fetched
+
+    Yields
+    ------
+    FetchedRepo
+        The repository entry from config, the Github repository object,
+        the list of ``Issue`` objects with codeuw label to sync
+        and the issues list to cache for the next sync
+    """
+    since = []
+    cached_issues = []
+    for repo in repos:
+        repo_path = "/".join([repo["org"], repo["repo"]])
+        since.append(codeuw_state.last_sync.get(repo_path))
+        # Only reuse a cached issues list if all its issues are synced
+        repo_cached_issues = codeuw_state.etags.get(repo_path)
+        if repo_cached_issues is not None and not set(repo_cached_issues.numbers) <= codeuw_state.issues.get(repo_path, {}).keys():
+            repo_cached_issues = None
+        cached_issues.append(repo_cached_issues)
+
+    # Rate limits are waited out by PyGithub's default retry policy
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        yield from executor.map(fetch_repo_issues, repos, since, cached_issues)
 
 
 def generate_code_uw_issues(
-    issues_with_label: List[Issue],
-    template_dict: Dict[str, Any],
+    issues_with_label: Iterable[Issue],
+    issue_template: IssueTemplate,
     project_name: str,
-    codeuw_state: OrderedDict,
+    codeuw_state: CodeuwState,
     gh_repo: Repository,
     codeuw_repo: Repository,
     dry_run: bool = False,
-) -> OrderedDict:
+    state_file: "str | Path" = DEFAULT_STATE_FILE,
+) -> CodeuwState:
     """Generate codeuw issues from
     the issues with codeuw label
 
     Parameters
     ----------
-    issues_with_label : List[Issue]
-        The list of ``Issue`` objects with codeuw label
-    template_dict : Dict[str, Any]
-        The template dictionary to create issue
+    issues_with_label : Iterable[Issue]
+        The ``Issue`` objects with codeuw label
+    issue_template : IssueTemplate
+        The parsed issue template to create issues from
     project_name : str
         The repository custom project name from config
-    codeuw_state : OrderedDict
-        The codeuw state dictionary
+    codeuw_state : CodeuwState
+        The codeuw state
     gh_repo : Repository
         The Github repository object to get issues from
     codeuw_repo : Repository
@@ -128,127 +444,243 @@ def generate_code_uw_issues(
     dry_run : bool, optional
         Flag to signify a dry run, which doesn't create issues
         within the codeuw repo, by default False
-        
+    state_file : str | Path, optional
+        The state file to append created issues to,
+        by default ``DEFAULT_STATE_FILE``
+
     Returns
     -------
-    OrderedDict
-        The updated codeuw state dictionary
+    CodeuwState
+        The updated codeuw state
     """
+    title_fn, body_fn, labels = issue_template
+
+    # Bind the repository attributes once, rather than going through
+    # PyGithub's lazy properties for every issue
+    gh_full_name = gh_repo.full_name
+    gh_html_url = gh_repo.html_url
+    cu_full_name = codeuw_repo.full_name
+    repo_state = codeuw_state.issues[gh_full_name]
+    new_issue_count = 0
+
     # Loop over issues and create one by one
     for issue in issues_with_label:
-        issue_template = template_dict.copy()
-        issue_title = issue_template["title"](
-            project_name=project_name, title_text=issue.title
-        )
-        issue_creator = issue.user.login
-
         # Skip the rest if issue already exists
-        if issue.number in codeuw_state["issues"][gh_repo.full_name]:
-            codeuw_issue_number = codeuw_state["issues"][gh_repo.full_name][issue.number]
-            logger.info(f"Issue ({gh_repo.full_name}#{issue.number}) already exists in repo: {codeuw_repo.full_name}#{codeuw_issue_number}")
+        if issue.number in repo_state:
+            codeuw_issue_number = repo_state[issue.number]
+            logger.info(f"Issue ({gh_full_name}#{issue.number}) already exists in repo: {cu_full_name}#{codeuw_issue_number}")
             continue
 
-        issue_template["title"] = issue_title
-        issue_template["body"] = issue_template["body"](
-            contact=f"@{issue_creator}",
-            description=issue.body if issue.body else "*No description provided.*",
-            repo=gh_repo.html_url,
-            issue=issue.html_url,
-            level=f"*@{issue_creator}: Please provide the level of the task here.*",
-            language=f"*@{issue_creator}: Please provide the programming language of the task here.*",
-            dependencies="*No response*",
+        issue_creator = issue.user.login
+        payload = IssuePayload(
+            title_fn(project_name=project_name, title_text=issue.title),
+            body_fn({
+                "contact": f"@{issue_creator}",
+                "description": issue.body if issue.body else "*No description provided.*",
+                "repo": gh_html_url,
+                "issue": issue.html_url,
+                "level": f"*@{issue_creator}: Please provide the level of the task here.*",
+                "language": f"*@{issue_creator}: Please provide the programming language of the task here.*",
+                "dependencies": "*No response*",
+            }),
+            labels,
         )
 
-        logger.info(f'Creating issue: {issue_template["title"]}')
-        logger.info(f'Labels: {issue_template["labels"]}')
+        logger.info(f"Creating issue: {payload.title}")
+        logger.info(f"Labels: {payload.labels}")
         if not dry_run:
-            created_issue = codeuw_repo.create_issue(**issue_template)
+            created_issue = codeuw_repo.create_issue(
+                title=payload.title, body=payload.body, labels=payload.labels
+            )
             logger.info(f"Issue successfully created: {created_issue.html_url}")
-            codeuw_state["issues"][gh_repo.full_name][issue.number] = created_issue.number
+            repo_state[issue.number] = created_issue.number
+            # Persist right away, so a failed run doesn't recreate this issue
+            append_state(
+                IssueAdded(
+                    repo=gh_full_name,
+                    src=issue.number,
+                    dst=created_issue.number,
+                    ts=int(time.time()),
+                ),
+                state_file=state_file,
+            )
         else:
             logger.info("Dry run, not creating issue. Here is the issue body:\n")
-            logger.info("\n" + issue_template["body"])
-            codeuw_state["issues"][gh_repo.full_name][issue.number] = -1
-        codeuw_state["last_modified"] = int(time.time())
+            logger.info("\n" + payload.body)
+            repo_state[issue.number] = -1
+        new_issue_count += 1
+
+    # Only touch the state when issues were added
+    if new_issue_count:
+        codeuw_state.last_modified = int(time.time())
     return codeuw_state
 
-def get_state(state_file: "str | Path" = DEFAULT_STATE_FILE) -> OrderedDict:
+def get_state(state_file: "str | Path" = DEFAULT_STATE_FILE) -> Tuple[CodeuwState, bool]:
     """
-    Get the state dictionary from the state file
+    Get the state from the state file, and whether state events
+    can be appended to the state file as is
     """
     state_file = Path(state_file)
-    if state_file.exists():
+    if state_file.exists() and state_file.stat().st_size:
         # Read the state file when it already exists
         return read_state(state_file=state_file)
     else:
         # If state file doesn't exist, create a new one
-        codeuw_state = OrderedDict({
-            "version": "1.0",
-            "created_time": int(time.time()),
-            "last_modified": int(time.time()),
-            "issues": {}
-        })
-        return codeuw_state
+        codeuw_state = CodeuwState(
+            version=STATE_VERSION,
+            created_time=int(time.time()),
+            last_modified=int(time.time()),
+            issues={},
+        )
+        return codeuw_state, False
 
-def write_state(state_dict: OrderedDict, state_file: "str | Path" = DEFAULT_STATE_FILE) -> None:
+def write_state(state: CodeuwState, state_file: "str | Path" = DEFAULT_STATE_FILE) -> None:
     """
-    Write state file to disk as messagepack file format
+    Write state file to disk as a single messagepack snapshot frame,
+    compacting any events appended to it
     """
     state_file = Path(state_file)
-    state_file.write_bytes(msgpack.packb(state_dict))
-    
-def read_state(state_file: "str | Path" = DEFAULT_STATE_FILE) -> OrderedDict:
+    state.version = STATE_VERSION
+    buf = msgspec.msgpack.encode(state)
+    tmp_file = state_file.with_name(state_file.name + ".tmp")
+    tmp_file.write_bytes(STATE_FRAME_HEADER.pack(len(buf)) + buf)
+    os.replace(tmp_file, state_file)
+
+
+def append_state(event: IssueAdded, state_file: "str | Path" = DEFAULT_STATE_FILE) -> None:
     """
-    Read state file from disk as messagepack file format
+    Append a state event to the state file as a messagepack frame
     """
     state_file = Path(state_file)
-    return msgpack.unpackb(state_file.read_bytes(), strict_map_key=False)
+    buf = msgspec.msgpack.encode(event)
+    with state_file.open("ab") as f:
+        f.write(STATE_FRAME_HEADER.pack(len(buf)) + buf)
+
+
+def _is_legacy_state(data: bytes) -> bool:
+    """
+    Check if the state file content predates framing,
+    in which case it is a single msgpack map
+    """
+    return bool(data) and (data[0] >> 4 == 0x8 or data[0] in (0xDE, 0xDF))
+
+
+def _split_state_frames(data: bytes) -> Tuple[List[bytes], bool]:
+    """
+    Split the state file content into its length-prefixed frames,
+    skipping an incomplete trailing frame left by an interrupted append.
+    Also returns whether the frames cover the whole content
+    """
+    frames = []
+    offset = 0
+    while offset < len(data):
+        if offset + STATE_FRAME_HEADER.size > len(data):
+            break
+        (length,) = STATE_FRAME_HEADER.unpack_from(data, offset)
+        offset += STATE_FRAME_HEADER.size
+        if offset + length > len(data):
+            break
+        frames.append(data[offset:offset + length])
+        offset += length
+    else:
+        return frames, True
+    logger.warning("Skipping incomplete trailing frame in state file")
+    return frames, False
+
+
+def read_state(state_file: "str | Path" = DEFAULT_STATE_FILE) -> Tuple[CodeuwState, bool]:
+    """
+    Read state file from disk as messagepack file format,
+    replaying any events appended after the snapshot.
+    Also returns whether the state file is made of complete frames,
+    so that state events can be appended to it
+    """
+    state_file = Path(state_file)
+    data = state_file.read_bytes()
+
+    if _is_legacy_state(data):
+        return msgspec.msgpack.decode(data, type=CodeuwState), False
+
+    decoder = msgspec.msgpack.Decoder(StateRecord)
+    frames, complete = _split_state_frames(data)
+    state = None
+    for frame in frames:
+        record = decoder.decode(frame)
+        if isinstance(record, CodeuwState):
+            if record.version != STATE_VERSION:
+                raise ValueError(f"State file {state_file} has unsupported version {record.version}, expected {STATE_VERSION}")
+            state = record
+        elif state is None:
+            raise ValueError(f"State file {state_file} doesn't start with a snapshot frame")
+        else:
+            state.issues.setdefault(record.repo, {})[record.src] = record.dst
+            state.last_modified = record.ts
+    if state is None:
+        raise ValueError(f"State file {state_file} has no complete snapshot frame")
+    return state, complete
 
 def main(config_file: str = DEFAULT_CONFIG_FILE, dry_run: bool = False):
     """
     Loads "codeuw" labeled issues from Github
     """
-    gh = setup_github()
     config = load_config(config_file=config_file)
 
+    # Get the codeuw state
+    codeuw_state, appendable = get_state()
+    if not dry_run and not appendable:
+        # Compact a missing, empty, legacy or partially written state file
+        # to a snapshot, so created issues can be appended to it
+        write_state(codeuw_state)
+
+    gh = setup_github()
+
     # Get codeuw repo
     codeuw_repo = gh.get_repo("/".join([config["owner"], config["repo"]]))
-    
-    # Get the state dictionary
-    codeuw_state = get_state()
 
-    # Get the template dictionary
-    template_dict = parse_issue_template(codeuw_repo)
+    # Get the issue template
+    issue_template = parse_issue_template(codeuw_repo, codeuw_state)
 
-    for repo in config["repos"]:
+    # Fetch the repos and their issues concurrently, since this is
+    # dominated by Github API round-trips, but create issues serially,
+    # as it mutates the state and is subject to secondary rate limits.
+    # Each repo is processed as soon as it is fetched, overlapping
+    # issue creation with the fetches still in flight
+    repo_issues = iter_repo_issues(config["repos"], codeuw_state)
+    for repo, gh_repo, issues_with_label, cached_issues, sync_time in repo_issues:
         repo_path = "/".join([repo["org"], repo["repo"]])
         # If repo not in state, add it
-        if repo_path not in codeuw_state["issues"]:
-            codeuw_state["issues"][repo_path] = {}
-
-        gh_repo = gh.get_repo(repo_path)
-        # Get issues with codeuw label only
-        issues_with_label = [
-            issue
-            for issue in gh_repo.get_issues()
-            if "codeuw" in [label.name for label in issue.labels]
-        ]
+        if repo_path not in codeuw_state.issues:
+            codeuw_state.issues[repo_path] = {}
+        synced_issue_count = len(codeuw_state.issues[repo_path])
+
         codeuw_state = generate_code_uw_issues(
             issues_with_label,
-            template_dict,
+            issue_template,
             repo['name'],
             codeuw_state,
             gh_repo,
             codeuw_repo,
             dry_run,
         )
-    
+
+        # Keep the issues list's ETag for a conditional request next time
+        if cached_issues is not None:
+            codeuw_state.etags[repo_path] = cached_issues
+        else:
+            codeuw_state.etags.pop(repo_path, None)
+
+        # Only fetch the issues updated since this run next time. The sync
+        # time is kept while nothing new gets synced, so idle runs leave the
+        # committed state file unchanged
+        if repo_path not in codeuw_state.last_sync or len(codeuw_state.issues[repo_path]) > synced_issue_count:
+            codeuw_state.last_sync[repo_path] = sync_time
+
     if not dry_run:
-        logger.info("Writing state file to disk")
+        logger.info("Compacting state file on disk")
         write_state(codeuw_state)
         
     repos_message = []
-    for repo, issue_numbers in codeuw_state["issues"].items():
+    for repo, issue_numbers in codeuw_state.issues.items():
         repos_message.append(f"{repo}: {len(issue_numbers)} issues")
     repos_message_str = "\n".join(repos_message)
 